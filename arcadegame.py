@@ -1,9 +1,12 @@
 import pygame
-from PIL import Image
+import numpy as np
 import random
+from bisect import bisect_right
+from collections import deque
+from itertools import islice
 import math
 from enum import Enum
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 import sys
 import os
 
@@ -32,7 +35,6 @@ class Config:
     
     # Player settings
     PLAYER_SPEED = 5
-    PLAYER_SCALE = 2
     PLAYER_FRAME_DELAY = 5
     DASH_DISTANCE = 80
     DASH_COOLDOWN = 1000  # milliseconds
@@ -68,104 +70,212 @@ class Config:
     ORANGE = (255, 165, 0)
     CYAN = (0, 255, 255)
 
-class Particle:
-    """Visual particle for effects"""
-    def __init__(self, x, y, color, velocity, lifetime):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx, self.vy = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = random.randint(2, 5)
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.1  # gravity
-        self.lifetime -= 1
-        return self.lifetime > 0
-    
-    def draw(self, screen):
-        alpha = self.lifetime / self.max_lifetime
-        color = tuple(int(c * alpha) for c in self.color)
-        if alpha > 0:
-            pygame.draw.circle(screen, color, (int(self.x), int(self.y)), self.size)
+# Half extents of a projectile, for centring trail quads
+_PROJECTILE_HW = Config.PROJECTILE_SIZE[0] // 2
+_PROJECTILE_HH = Config.PROJECTILE_SIZE[1] // 2
+# Sine lookup table for the power-up bobbing animation (size must be a power of two)
+_SIN_LUT_SIZE = 1024
+_SIN_LUT = [math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)]
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
 
 class ParticleSystem:
-    """Manages visual particles"""
+    """Manages visual particles as one fixed-capacity packed NumPy block (one column per particle)"""
+    
+    # Row layout of the particle block
+    X, Y, VX, VY, LIFETIME, MAX_LIFETIME, SIZE, COLOR = range(8)
+    ROWS = 8
+    CAPACITY = 1024  # Once full, new particles replace the oldest ones
+    
+    # Per-frame (VY, LIFETIME) increments: gravity and one tick of age
+    _VY_LIFETIME_STEP = np.array([[0.1], [-1.0]], dtype=np.float32)
+    
+    # Precomputed fade-to-black gradient per particle color, shared by all systems
+    GRADIENT_STEPS = 64
+    _color_ids: Dict[Tuple[int, int, int], int] = {}
+    _gradients = np.empty((0, GRADIENT_STEPS, 3), dtype=np.int32)
+    
+    # Pre-drawn particle discs, keyed by (color id * GRADIENT_STEPS + gradient step) * SIZE_KEYS + size
+    SIZE_KEYS = 8  # Particle sizes are 2-5
+    _sprites: Dict[int, pygame.Surface] = {}
+    
     def __init__(self):
-        self.particles = []
+        # Live particles occupy the first self.count columns, oldest first; the block never grows
+        self.data = np.zeros((self.ROWS, self.CAPACITY), dtype=np.float32)
+        self.count = 0
+    
+    @classmethod
+    def _color_id(cls, color) -> int:
+        """Return the gradient table row for color, building it on first use"""
+        if color not in cls._color_ids:
+            last = cls.GRADIENT_STEPS - 1
+            gradient = np.array([[int(c * i / last) for c in color] for i in range(cls.GRADIENT_STEPS)],
+                                dtype=np.int32)
+            cls._gradients = np.concatenate((cls._gradients, gradient[None]))
+            cls._color_ids[color] = len(cls._color_ids)
+        return cls._color_ids[color]
+    
+    def _spawn(self, x, y, color, vx, vy, lifetime):
+        """Append a batch of particles sharing a position and color after the live ones"""
+        count = len(vx)
+        overflow = self.count + count - self.CAPACITY
+        if overflow > 0:
+            # Full: shift out the oldest particles to make room
+            self.data[:, :self.count - overflow] = self.data[:, overflow:self.count]
+            self.count -= overflow
+        
+        end = self.count + count
+        new = self.data[:, self.count:end]
+        new[self.X] = x
+        new[self.Y] = y
+        new[self.VX] = vx
+        new[self.VY] = vy
+        new[self.LIFETIME] = lifetime
+        new[self.MAX_LIFETIME] = lifetime
+        new[self.SIZE] = np.random.randint(2, 6, count)
+        new[self.COLOR] = self._color_id(color)
+        self.count = end
     
     def add_explosion(self, x, y, color=Config.ORANGE, count=15):
-        for _ in range(count):
-            velocity = (random.uniform(-3, 3), random.uniform(-5, -1))
-            lifetime = random.randint(20, 40)
-            self.particles.append(Particle(x, y, color, velocity, lifetime))
+        self._spawn(x, y, color,
+                    np.random.uniform(-3, 3, count),
+                    np.random.uniform(-5, -1, count),
+                    np.random.randint(20, 41, count))
     
     def add_trail(self, x, y, color=Config.CYAN):
-        velocity = (random.uniform(-1, 1), random.uniform(-1, 1))
-        lifetime = random.randint(10, 20)
-        self.particles.append(Particle(x, y, color, velocity, lifetime))
+        self._spawn(x, y, color,
+                    np.random.uniform(-1, 1, 1),
+                    np.random.uniform(-1, 1, 1),
+                    np.random.randint(10, 21, 1))
     
     def update(self):
-        self.particles = [p for p in self.particles if p.update()]
+        if not self.count:
+            return
+        data = self.data[:, :self.count]
+        data[self.X:self.Y + 1] += data[self.VX:self.VY + 1]  # x, y in one op
+        data[self.VY:self.LIFETIME + 1] += self._VY_LIFETIME_STEP  # gravity and aging in one op
+        
+        # Compact survivors to the front of the block, only on frames where something expired
+        if data[self.LIFETIME].min() <= 0:
+            keep = np.flatnonzero(data[self.LIFETIME] > 0)
+            data[:, :len(keep)] = data[:, keep]
+            self.count = len(keep)
     
-    def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
+    def draw(self, screen) -> List[pygame.Rect]:
+        if not self.count:
+            return []
+        data = self.data[:, :self.count]
+        
+        # Fade towards black as the particle ages, via the gradient table
+        steps = (data[self.LIFETIME] / data[self.MAX_LIFETIME] * (self.GRADIENT_STEPS - 1)).astype(np.int32)
+        
+        # Sprite keys and top-left corners for every particle, computed in bulk
+        sizes = data[self.SIZE].astype(np.int32)
+        keys = (data[self.COLOR].astype(np.int32) * self.GRADIENT_STEPS + steps) * self.SIZE_KEYS + sizes
+        xs = data[self.X].astype(np.int32) - sizes
+        ys = data[self.Y].astype(np.int32) - sizes
+        
+        # Cull particles whose disc lies wholly off the target surface
+        width, height = screen.get_size()
+        visible = (xs < width) & (ys < height) & (xs + 2 * sizes > 0) & (ys + 2 * sizes > 0)
+        if not visible.all():
+            keys, xs, ys = keys[visible], xs[visible], ys[visible]
+        
+        # Blit cached discs for every particle in one batched call
+        sprites = self._sprites
+        blit_list = []
+        for key, x, y in zip(keys.tolist(), xs.tolist(), ys.tolist()):
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = sprites[key] = self._build_sprite(key)
+            blit_list.append((sprite, (x, y)))
+        return screen.blits(blit_list)
+    
+    @classmethod
+    def _build_sprite(cls, key) -> pygame.Surface:
+        """Draw one particle disc onto its own transparent surface"""
+        size = key % cls.SIZE_KEYS
+        color_id, step = divmod(key // cls.SIZE_KEYS, cls.GRADIENT_STEPS)
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA).convert_alpha()
+        color = cls._gradients[color_id, step].tolist()
+        pygame.draw.circle(sprite, color, (size, size), size)
+        return sprite
 
 class PowerUp:
     """Power-up collectibles"""
-    def __init__(self, x, y):
+    
+    __slots__ = ('type', 'rect', 'bob_offset', 'spawn_time', 'image')
+    
+    # Define colors and symbols for each power-up type
+    properties = {
+        PowerUpType.SHIELD: {'color': Config.BLUE, 'symbol': 'S'},
+        PowerUpType.RAPID_FIRE: {'color': Config.RED, 'symbol': 'R'},
+        PowerUpType.SLOW_TIME: {'color': Config.PURPLE, 'symbol': 'T'},
+        PowerUpType.MULTI_LIFE: {'color': Config.GREEN, 'symbol': '+'}
+    }
+    COLORS = {powerup_type: props['color'] for powerup_type, props in properties.items()}
+    
+    GLOW_LAYERS = 3
+    IMAGE_OFFSET = -(GLOW_LAYERS - 1) * 2  # Sprite topleft relative to rect topleft
+    
+    # Composited sprite (glow, disc and symbol) per power-up type
+    _images: Dict[PowerUpType, pygame.Surface] = {}
+    
+    def __init__(self, x, y, now):
         self.type = random.choice(list(PowerUpType))
         self.rect = pygame.Rect(x, y, Config.POWERUP_SIZE, Config.POWERUP_SIZE)
         self.bob_offset = random.uniform(0, math.pi * 2)
-        self.spawn_time = pygame.time.get_ticks()
-        
-        # Define colors and symbols for each power-up type
-        self.properties = {
-            PowerUpType.SHIELD: {'color': Config.BLUE, 'symbol': 'S'},
-            PowerUpType.RAPID_FIRE: {'color': Config.RED, 'symbol': 'R'},
-            PowerUpType.SLOW_TIME: {'color': Config.PURPLE, 'symbol': 'T'},
-            PowerUpType.MULTI_LIFE: {'color': Config.GREEN, 'symbol': '+'}
-        }
-    
-    def update(self):
-        # Bobbing animation
-        time_alive = pygame.time.get_ticks() - self.spawn_time
-        self.rect.y += math.sin(time_alive * 0.005 + self.bob_offset) * 0.5
-        return time_alive < 10000  # Power-ups last 10 seconds
-    
-    def draw(self, screen):
-        props = self.properties[self.type]
+        self.spawn_time = now
         
-        # Draw glowing effect
-        for i in range(3):
+        if self.type not in PowerUp._images:
+            PowerUp._images[self.type] = self._build_image(self.type)
+        self.image = PowerUp._images[self.type]
+    
+    @classmethod
+    def _build_image(cls, powerup_type) -> pygame.Surface:
+        """Pre-render the glow, disc and symbol for one power-up type into a single sprite"""
+        props = cls.properties[powerup_type]
+        size = Config.POWERUP_SIZE
+        full_size = size - cls.IMAGE_OFFSET * 2
+        image = pygame.Surface((full_size, full_size), pygame.SRCALPHA).convert_alpha()
+        
+        # Glow layers nest, so fill from the outermost in with the combined coverage of every layer over it
+        transparency = 1.0
+        for i in reversed(range(cls.GLOW_LAYERS)):
             alpha = 50 - i * 15
-            glow_surf = pygame.Surface((Config.POWERUP_SIZE + i * 4, Config.POWERUP_SIZE + i * 4))
-            glow_surf.set_alpha(alpha)
-            glow_surf.fill(props['color'])
-            glow_rect = glow_surf.get_rect(center=self.rect.center)
-            screen.blit(glow_surf, glow_rect)
+            transparency *= 1 - alpha / 255
+            margin = (cls.GLOW_LAYERS - 1 - i) * 2
+            image.fill((*props['color'], int((1 - transparency) * 255)),
+                       (margin, margin, size + i * 4, size + i * 4))
         
-        # Draw main power-up
-        pygame.draw.circle(screen, props['color'], self.rect.center, Config.POWERUP_SIZE // 2)
-        pygame.draw.circle(screen, Config.WHITE, self.rect.center, Config.POWERUP_SIZE // 2, 2)
+        # Main disc
+        center = (full_size // 2, full_size // 2)
+        pygame.draw.circle(image, props['color'], center, size // 2)
+        pygame.draw.circle(image, Config.WHITE, center, size // 2, 2)
         
-        # Draw symbol
+        # Symbol
         font = pygame.font.SysFont(None, 20)
         text = font.render(props['symbol'], True, Config.WHITE)
-        text_rect = text.get_rect(center=self.rect.center)
-        screen.blit(text, text_rect)
+        image.blit(text, text.get_rect(center=center))
+        return image
+    
+    def update(self, now):
+        # Bobbing animation
+        time_alive = now - self.spawn_time
+        phase = int((time_alive * 0.005 + self.bob_offset) * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)
+        self.rect.y += _SIN_LUT[phase] * 0.5
+        return time_alive < 10000  # Power-ups last 10 seconds
 
 class OpeningCrawl:
     """Star Wars-style opening crawl"""
     
+    SCALE_STEPS = 16  # Pre-rendered perspective sizes between 0.3x and 1.0x
+    
     def __init__(self):
         self.font_title = pygame.font.Font(None, 48)
         self.font_text = pygame.font.Font(None, 28)
         self.font_intro = pygame.font.Font(None, 32)
+        self.skip_font = pygame.font.Font(None, 24)
+        self.skip_text_surf = self.skip_font.render("Press any key to skip...", True, Config.WHITE)
         
         # Opening crawl text
         self.text_lines = [
@@ -208,9 +318,37 @@ class OpeningCrawl:
                 surface = self.font_text.render("", True, Config.YELLOW)
             self.text_surfaces.append(surface)
         
+        # Pre-scale every line once for the perspective effect; None where a step collapses to nothing
+        self.scaled_surfaces = []
+        for surface in self.text_surfaces:
+            steps = []
+            for k in range(self.SCALE_STEPS):
+                scale = 0.3 + 0.7 * k / (self.SCALE_STEPS - 1)
+                new_width = int(surface.get_width() * scale)
+                new_height = int(surface.get_height() * scale)
+                if new_width > 0 and new_height > 0:
+                    steps.append(pygame.transform.smoothscale(surface, (new_width, new_height)))
+                else:
+                    steps.append(None)
+            self.scaled_surfaces.append(steps)
+        
+        # Static star field, rendered once and rebuilt only if the window is resized
+        self.starfield = self._build_starfield()
+        
         # Initialize all attributes
         self.reset()
     
+    def _build_starfield(self) -> pygame.Surface:
+        """Render the star field background to its own surface"""
+        starfield = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
+        starfield.fill((5, 5, 15))  # Very dark blue instead of pure black
+        for _ in range(50):
+            x = random.randint(0, Config.SCREEN_WIDTH)
+            y = random.randint(0, Config.SCREEN_HEIGHT)
+            brightness = random.randint(100, 255)
+            pygame.draw.circle(starfield, (brightness, brightness, brightness), (x, y), 1)
+        return starfield
+    
     def reset(self):
         """Reset the crawl for replay"""
         self.text_y_positions = [Config.SCREEN_HEIGHT + i * 50 for i in range(len(self.text_surfaces))]
@@ -238,14 +376,9 @@ class OpeningCrawl:
     def draw(self, screen):
         """Draw the opening crawl"""
         # Black starfield background
-        screen.fill((5, 5, 15))  # Very dark blue instead of pure black
-        
-        # Draw stars
-        for _ in range(50):
-            x = random.randint(0, Config.SCREEN_WIDTH)
-            y = random.randint(0, Config.SCREEN_HEIGHT)
-            brightness = random.randint(100, 255)
-            pygame.draw.circle(screen, (brightness, brightness, brightness), (x, y), 1)
+        if self.starfield.get_size() != (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT):
+            self.starfield = self._build_starfield()
+        screen.blit(self.starfield, (0, 0))
         
         # Draw scrolling text with perspective effect
         for i, surface in enumerate(self.text_surfaces):
@@ -257,15 +390,12 @@ class OpeningCrawl:
                 if y_pos < Config.SCREEN_HEIGHT * 0.4:
                     scale_factor = max(0.3, (y_pos + 100) / (Config.SCREEN_HEIGHT * 0.4 + 100))
                     
-                    # Scale the surface
+                    # Pick the nearest pre-scaled surface
                     if scale_factor < 1.0:
-                        original_width = surface.get_width()
-                        original_height = surface.get_height()
-                        new_width = int(original_width * scale_factor)
-                        new_height = int(original_height * scale_factor)
+                        idx = min(self.SCALE_STEPS - 1, round((scale_factor - 0.3) / 0.7 * (self.SCALE_STEPS - 1)))
+                        scaled_surface = self.scaled_surfaces[i][idx]
                         
-                        if new_width > 0 and new_height > 0:
-                            scaled_surface = pygame.transform.scale(surface, (new_width, new_height))
+                        if scaled_surface is not None:
                             x_pos = Config.SCREEN_WIDTH // 2 - scaled_surface.get_width() // 2
                             screen.blit(scaled_surface, (x_pos, y_pos))
                     else:
@@ -277,9 +407,7 @@ class OpeningCrawl:
         
         # Draw skip instruction
         if self.can_skip:
-            skip_font = pygame.font.Font(None, 24)
-            skip_text = skip_font.render("Press any key to skip...", True, Config.WHITE)
-            screen.blit(skip_text, (10, Config.SCREEN_HEIGHT - 30))
+            screen.blit(self.skip_text_surf, (10, Config.SCREEN_HEIGHT - 30))
 
 class AssetManager:
     """Handles loading and managing game assets"""
@@ -288,17 +416,18 @@ class AssetManager:
         self.images = {}
         self.sounds = {}
         self.player_frames = []
+        self.player_trail_frames = []  # Separate copies so trail alpha never touches the live frames
         
     def load_assets(self):
         """Load all game assets with error handling"""
         try:
             # Load images
-            self.images['menu_bg'] = self._load_image("images/arcade.background.png")
+            self.images['menu_bg'] = self._load_image("images/arcade.background.png", alpha=False)
             self.images['start_button'] = self._load_image("images/start.png")
             self.images['enemy'] = self._load_image("images/enemy.png", Config.ENEMY_SCALE)
             
-            # Load player GIF frames
-            self._load_player_gif("images/player.gif")
+            # Load player animation frames (extracted from images/player.gif by tools/extract_gif.py)
+            self._load_player_frames("images/player")
             
             # Load sounds
             self.sounds['hit'] = self._load_sound("sound/pop.mp3")
@@ -309,12 +438,14 @@ class AssetManager:
             print(f"Error loading assets: {e}")
             sys.exit(1)
     
-    def _load_image(self, path: str, scale: float = 1.0) -> pygame.Surface:
-        """Load and optionally scale an image"""
+    def _load_image(self, path: str, scale: float = 1.0, alpha: bool = True) -> pygame.Surface:
+        """Load an image in the display pixel format and optionally scale it"""
         if not os.path.exists(path):
             raise FileNotFoundError(f"Image file not found: {path}")
         
-        image = pygame.image.load(path).convert_alpha()
+        # Opaque images skip per-pixel alpha entirely for the fastest blit path
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if alpha else image.convert()
         if scale != 1.0:
             new_size = (int(image.get_width() * scale), int(image.get_height() * scale))
             image = pygame.transform.scale(image, new_size)
@@ -326,32 +457,37 @@ class AssetManager:
             raise FileNotFoundError(f"Sound file not found: {path}")
         return pygame.mixer.Sound(path)
     
-    def _load_player_gif(self, path: str):
-        """Load and process GIF frames for player animation"""
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"GIF file not found: {path}")
-            
-        gif = Image.open(path)
-        try:
-            while True:
-                frame = gif.copy().convert("RGBA")
-                new_size = (frame.width * Config.PLAYER_SCALE, frame.height * Config.PLAYER_SCALE)
-                frame = frame.resize(new_size, Image.LANCZOS)
-                
-                # Convert PIL image to pygame surface
-                pygame_image = pygame.image.fromstring(
-                    frame.tobytes(), frame.size, frame.mode
-                ).convert_alpha()
-                self.player_frames.append(pygame_image)
-                gif.seek(len(self.player_frames))
-        except EOFError:
-            pass
+    def _load_player_frames(self, directory: str):
+        """Load pre-extracted, pre-scaled PNG frames for player animation"""
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(
+                f"Player frames not found: {directory} (run tools/extract_gif.py)"
+            )
+        
+        # Only the frame_NNN.png files written by the extractor are animation frames
+        frame_names = sorted(name for name in os.listdir(directory)
+                             if name.startswith("frame_") and name.endswith(".png"))
+        if not frame_names:
+            raise FileNotFoundError(f"No player frames in: {directory}")
+        
+        for name in frame_names:
+            frame = pygame.image.load(os.path.join(directory, name)).convert_alpha()
+            self.player_frames.append(frame)
+            self.player_trail_frames.append(frame.copy())
 
 class Player:
     """Player class handling movement and animation"""
     
-    def __init__(self, frames: List[pygame.Surface], start_pos: Tuple[int, int]):
+    __slots__ = ('frames', 'trail_frames', 'current_frame', 'frame_counter', 'rect', 'frozen',
+                 'screen_bounds', 'last_dash_time', 'is_dashing', 'dash_trail',
+                 'shield_active', 'shield_end_time', 'rapid_fire_active', 'rapid_fire_end_time',
+                 'slow_time_active', 'slow_time_end_time', '_shield_surf')
+    
+    def __init__(self, frames: List[pygame.Surface], trail_frames: List[pygame.Surface],
+                 start_pos: Tuple[int, int], screen_bounds: pygame.Rect):
         self.frames = frames
+        self.trail_frames = trail_frames
+        self.screen_bounds = screen_bounds  # Shared with Game, resized in place
         self.current_frame = 0
         self.frame_counter = 0
         self.rect = frames[0].get_rect(center=start_pos)
@@ -370,7 +506,11 @@ class Player:
         self.slow_time_active = False
         self.slow_time_end_time = 0
         
-    def update(self):
+        # Shield overlay: a flat color, so an opaque display-format surface with surface alpha
+        self._shield_surf = pygame.Surface((self.rect.width + 10, self.rect.height + 10)).convert()
+        self._shield_surf.fill(Config.BLUE)
+        
+    def update(self, now):
         """Update player animation and effects"""
         if not self.frozen:
             self.frame_counter += 1
@@ -379,20 +519,19 @@ class Player:
                 self.current_frame = (self.current_frame + 1) % len(self.frames)
         
         # Update power-up effects
-        current_time = pygame.time.get_ticks()
-        if self.shield_active and current_time > self.shield_end_time:
+        if self.shield_active and now > self.shield_end_time:
             self.shield_active = False
-        if self.rapid_fire_active and current_time > self.rapid_fire_end_time:
+        if self.rapid_fire_active and now > self.rapid_fire_end_time:
             self.rapid_fire_active = False
-        if self.slow_time_active and current_time > self.slow_time_end_time:
+        if self.slow_time_active and now > self.slow_time_end_time:
             self.slow_time_active = False
         
         # Update dash trail
         if self.dash_trail:
             self.dash_trail = [(pos, alpha - 30) for pos, alpha in self.dash_trail if alpha > 0]
     
-    def move(self, keys):
-        """Handle player movement"""
+    def move(self, dx: int, dy: int):
+        """Handle player movement along the decoded input direction"""
         if self.frozen:
             return
         
@@ -400,31 +539,17 @@ class Player:
         if self.slow_time_active:
             speed *= 1.5  # Move faster when time is slowed
             
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            self.rect.x -= speed
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            self.rect.x += speed
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            self.rect.y -= speed
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            self.rect.y += speed
+        if dx:
+            self.rect.x += dx * speed
+        if dy:
+            self.rect.y += dy * speed
         
         # Keep player on screen
-        self.rect.clamp_ip(pygame.Rect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+        self.rect.clamp_ip(self.screen_bounds)
     
-    def dash(self, keys):
+    def dash(self, dx: int, dy: int, dash_pressed: bool, now: int):
         """Handle dash ability"""
-        current_time = pygame.time.get_ticks()
-        if (current_time - self.last_dash_time > Config.DASH_COOLDOWN and 
-            (keys[pygame.K_SPACE] or keys[pygame.K_LSHIFT])):
-            
-            # Determine dash direction
-            dx, dy = 0, 0
-            if keys[pygame.K_a] or keys[pygame.K_LEFT]: dx = -1
-            if keys[pygame.K_d] or keys[pygame.K_RIGHT]: dx = 1
-            if keys[pygame.K_w] or keys[pygame.K_UP]: dy = -1
-            if keys[pygame.K_s] or keys[pygame.K_DOWN]: dy = 1
-            
+        if now - self.last_dash_time > Config.DASH_COOLDOWN and dash_pressed:
             # Default to forward dash if no direction
             if dx == 0 and dy == 0:
                 dx = 1
@@ -438,7 +563,7 @@ class Player:
             old_pos = self.rect.center
             self.rect.x += int(dx * Config.DASH_DISTANCE)
             self.rect.y += int(dy * Config.DASH_DISTANCE)
-            self.rect.clamp_ip(pygame.Rect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+            self.rect.clamp_ip(self.screen_bounds)
             
             # Add trail effect
             for i in range(5):
@@ -446,45 +571,44 @@ class Player:
                 trail_y = old_pos[1] + (self.rect.centery - old_pos[1]) * (i / 5)
                 self.dash_trail.append(((trail_x, trail_y), 150 - i * 30))
             
-            self.last_dash_time = current_time
+            self.last_dash_time = now
             return True
         return False
     
-    def activate_powerup(self, powerup_type):
+    def activate_powerup(self, powerup_type, now):
         """Activate a power-up effect"""
-        current_time = pygame.time.get_ticks()
-        
         if powerup_type == PowerUpType.SHIELD:
             self.shield_active = True
-            self.shield_end_time = current_time + Config.POWERUP_DURATION
+            self.shield_end_time = now + Config.POWERUP_DURATION
         elif powerup_type == PowerUpType.RAPID_FIRE:
             self.rapid_fire_active = True
-            self.rapid_fire_end_time = current_time + Config.POWERUP_DURATION
+            self.rapid_fire_end_time = now + Config.POWERUP_DURATION
         elif powerup_type == PowerUpType.SLOW_TIME:
             self.slow_time_active = True
-            self.slow_time_end_time = current_time + Config.POWERUP_DURATION
+            self.slow_time_end_time = now + Config.POWERUP_DURATION
     
-    def draw(self, screen: pygame.Surface):
-        """Draw the player"""
+    def draw(self, screen: pygame.Surface, now: int) -> List[pygame.Rect]:
+        """Draw the player, returning the screen areas drawn"""
+        dirty = []
+        
         # Draw dash trail
+        trail_surf = self.trail_frames[self.current_frame]
         for (x, y), alpha in self.dash_trail:
-            trail_surf = pygame.Surface((self.rect.width, self.rect.height))
             trail_surf.set_alpha(alpha)
-            trail_surf.blit(self.frames[self.current_frame], (0, 0))
-            screen.blit(trail_surf, (x - self.rect.width // 2, y - self.rect.height // 2))
+            dirty.append(screen.blit(trail_surf, (x - self.rect.width // 2, y - self.rect.height // 2)))
         
         # Draw player
-        screen.blit(self.frames[self.current_frame], self.rect)
+        dirty.append(screen.blit(self.frames[self.current_frame], self.rect))
         
         # Draw shield effect
         if self.shield_active:
-            time_left = (self.shield_end_time - pygame.time.get_ticks()) / Config.POWERUP_DURATION
-            alpha = int(100 * abs(math.sin(pygame.time.get_ticks() * 0.01)))
-            shield_surf = pygame.Surface((self.rect.width + 10, self.rect.height + 10))
-            shield_surf.set_alpha(alpha)
-            shield_surf.fill(Config.BLUE)
-            shield_rect = shield_surf.get_rect(center=self.rect.center)
-            screen.blit(shield_surf, shield_rect)
+            time_left = (self.shield_end_time - now) / Config.POWERUP_DURATION
+            alpha = int(100 * abs(math.sin(now * 0.01)))
+            self._shield_surf.set_alpha(alpha)
+            shield_rect = self._shield_surf.get_rect(center=self.rect.center)
+            dirty.append(screen.blit(self._shield_surf, shield_rect))
+        
+        return dirty
     
     def freeze(self, frozen: bool = True):
         """Freeze/unfreeze player animation"""
@@ -493,36 +617,44 @@ class Player:
 class Projectile:
     """Individual projectile class"""
     
+    __slots__ = ('rect', 'speed', 'trail_positions')
+    
+    # Trail quads shared by all projectiles, one per trail step with its alpha baked in
+    _trail_surfs = None
+    # Pre-rendered body (fill plus white outline) shared by all projectiles
+    body_surf = None
+    
     def __init__(self, x: int, y: int, speed_multiplier: float = 1.0):
         self.rect = pygame.Rect(x, y, *Config.PROJECTILE_SIZE)
         self.speed = Config.PROJECTILE_SPEED * speed_multiplier
-        self.trail_positions = []
+        self.trail_positions = deque(maxlen=5)  # Oldest centre drops off in C
+        
+        if Projectile._trail_surfs is None:
+            trail_color = tuple(min(255, c + 50) for c in Config.PROJECTILE_COLOR)
+            Projectile._trail_surfs = []
+            for i in range(4):
+                trail_surf = pygame.Surface(Config.PROJECTILE_SIZE, pygame.SRCALPHA).convert_alpha()
+                trail_surf.fill((*trail_color, (i + 1) * 40))
+                Projectile._trail_surfs.append(trail_surf)
+            
+            body_surf = pygame.Surface(Config.PROJECTILE_SIZE).convert()
+            body_surf.fill(Config.PROJECTILE_COLOR)
+            pygame.draw.rect(body_surf, Config.WHITE, body_surf.get_rect(), 1)
+            Projectile.body_surf = body_surf
     
     def update(self, time_multiplier: float = 1.0) -> bool:
         """Update projectile position. Returns False if off-screen"""
         # Add trail effect
         self.trail_positions.append(self.rect.center)
-        if len(self.trail_positions) > 5:
-            self.trail_positions.pop(0)
         
         self.rect.x += self.speed * time_multiplier
         return self.rect.x <= Config.SCREEN_WIDTH
     
-    def draw(self, screen: pygame.Surface):
-        """Draw the projectile with trail"""
-        # Draw trail
-        for i, pos in enumerate(self.trail_positions[:-1]):
-            alpha = (i + 1) * 40
-            trail_color = tuple(min(255, c + 50) for c in Config.PROJECTILE_COLOR)
-            trail_surf = pygame.Surface(Config.PROJECTILE_SIZE)
-            trail_surf.set_alpha(alpha)
-            trail_surf.fill(trail_color)
-            screen.blit(trail_surf, (pos[0] - Config.PROJECTILE_SIZE[0]//2, 
-                                   pos[1] - Config.PROJECTILE_SIZE[1]//2))
-        
-        # Draw main projectile
-        pygame.draw.rect(screen, Config.PROJECTILE_COLOR, self.rect)
-        pygame.draw.rect(screen, Config.WHITE, self.rect, 1)
+    def trail_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Return (surface, position) pairs for the trail, for Surface.blits"""
+        return [(trail_surf, (pos[0] - _PROJECTILE_HW, pos[1] - _PROJECTILE_HH))
+                for trail_surf, pos in zip(self._trail_surfs,
+                                           islice(self.trail_positions, max(0, len(self.trail_positions) - 1)))]
 
 class ProjectileManager:
     """Manages all projectiles"""
@@ -551,32 +683,48 @@ class ProjectileManager:
         if self.fire_counter >= fire_delay:
             self.fire_counter = 0
             
-            # Multiple projectiles at higher difficulty
+            # Multiple projectiles at higher difficulty, spawned as one volley
             num_projectiles = 1 if self.difficulty_multiplier < 2 else 2
-            for _ in range(num_projectiles):
-                random_y = random.randint(0, Config.SCREEN_HEIGHT - Config.PROJECTILE_SIZE[1])
-                speed_mult = random.uniform(0.8, 1.2) * self.difficulty_multiplier
-                self.projectiles.append(Projectile(0, random_y, speed_mult))
-        
-        # Update existing projectiles
-        self.projectiles = [proj for proj in self.projectiles 
-                          if proj.update(time_multiplier)]
+            max_y = Config.SCREEN_HEIGHT - Config.PROJECTILE_SIZE[1]
+            self.projectiles.extend(
+                Projectile(0, random.randint(0, max_y),
+                           random.uniform(0.8, 1.2) * self.difficulty_multiplier)
+                for _ in range(num_projectiles)
+            )
+        
+        # Update existing projectiles, compacting survivors in place
+        projectiles = self.projectiles
+        kept = 0
+        for proj in projectiles:
+            if proj.update(time_multiplier):
+                projectiles[kept] = proj
+                kept += 1
+        del projectiles[kept:]
     
-    def draw(self, screen: pygame.Surface):
-        """Draw all projectiles"""
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """Draw all projectiles, returning the screen areas drawn"""
+        if not self.projectiles:
+            return []
+        
+        # Submit every trail quad, then every body on top, in a single batched blit
+        blit_list = []
         for projectile in self.projectiles:
-            projectile.draw(screen)
+            blit_list.extend(projectile.trail_blits())
+        body_surf = Projectile.body_surf
+        blit_list.extend((body_surf, projectile.rect) for projectile in self.projectiles)
+        return screen.blits(blit_list)
     
     def check_collision(self, player_rect: pygame.Rect, player) -> bool:
         """Check collision with player and remove colliding projectiles"""
         if player.shield_active:
             return False  # Shield blocks all damage
             
-        for i, projectile in enumerate(self.projectiles):
-            if projectile.rect.colliderect(player_rect):
-                del self.projectiles[i]
-                return True
-        return False
+        # Sweep all projectiles in C; at most one hit is consumed per frame
+        hit_index = player_rect.collidelist([proj.rect for proj in self.projectiles])
+        if hit_index == -1:
+            return False
+        del self.projectiles[hit_index]
+        return True
     
     def update_difficulty(self, score):
         """Increase difficulty based on score"""
@@ -605,12 +753,13 @@ class Cutscene:
             "We're trapped here forever and you'll never see your sister again",
             "I don't care, I will keep looking!"
         ]
+        self.message_surfaces = [self.font.render(m, True, Config.WHITE) for m in self.messages]
     
-    def start(self, player_rect: pygame.Rect):
+    def start(self, player_rect: pygame.Rect, now: int):
         """Start the cutscene"""
         self.active = True
         self.stage = 0
-        self.timer_start = pygame.time.get_ticks()
+        self.timer_start = now
         
         # Position enemy near player
         enemy_width = self.enemy_image.get_width()
@@ -622,19 +771,17 @@ class Cutscene:
             enemy_height
         )
     
-    def update(self) -> bool:
+    def update(self, now: int) -> bool:
         """Update cutscene. Returns True if cutscene is complete"""
         if not self.active:
             return True
-            
-        current_time = pygame.time.get_ticks()
         
-        if current_time - self.timer_start >= Config.CUTSCENE_MESSAGE_DURATION:
+        if now - self.timer_start >= Config.CUTSCENE_MESSAGE_DURATION:
             self.stage += 1
             if self.stage >= len(self.messages):
                 self.active = False
                 return True
-            self.timer_start = current_time
+            self.timer_start = now
         
         return False
     
@@ -648,7 +795,7 @@ class Cutscene:
         
         # Draw current message
         if self.stage < len(self.messages):
-            text_surface = self.font.render(self.messages[self.stage], True, Config.WHITE)
+            text_surface = self.message_surfaces[self.stage]
             
             if self.stage == 0:  # Enemy speaking
                 text_pos = (self.enemy_rect.x, self.enemy_rect.y - 40)
@@ -671,9 +818,12 @@ class Game:
         
         # Initialize game objects
         self.opening_crawl = OpeningCrawl()
+        self._screen_bounds = pygame.Rect(0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
         self.player = Player(
             self.asset_manager.player_frames,
-            (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2)
+            self.asset_manager.player_trail_frames,
+            (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2),
+            self._screen_bounds
         )
         self.projectile_manager = ProjectileManager()
         self.cutscene = Cutscene(self.asset_manager.images['enemy'])
@@ -690,13 +840,65 @@ class Game:
         self.small_font = pygame.font.SysFont(None, 24)
         self.game_start_time = 0
         self.cutscene_triggered = False
+        self.now = 0  # Frame timestamp, read once per tick at the top of run()
+        
+        # Static text, rendered once
+        controls = [
+            "Controls:",
+            "WASD or Arrow Keys - Move",
+            "Space or Shift - Dash",
+            "",
+            "Power-ups:",
+            "S - Shield", "R - Slow Projectiles", 
+            "T - Slow Time", "+ - Extra Life"
+        ]
+        self._menu_control_blits = []
+        for i, text in enumerate(controls):
+            color = Config.YELLOW if i == 0 or i == 4 else Config.WHITE
+            font = self.font if i == 0 or i == 4 else self.small_font
+            if text:  # Skip empty lines
+                self._menu_control_blits.append((font.render(text, True, color), (50, 50 + i * 25)))
+        
+        self._game_over_text = self.font.render("Game Over!", True, Config.RED)
+        self._game_over_glow = self.font.render("Game Over!", True, (100, 0, 0))
+        self._game_over_blits = []  # Glow and title (surface, rect) pairs for the current screen size
+        self._game_over_size = None
+        self._continue_text = self.small_font.render("Click anywhere to return to menu", True, Config.WHITE)
+        
+        # Performance ratings by ascending score threshold, for bisect lookup
+        ratings = [(0, "Keep Trying!", Config.WHITE), (1000, "GOOD!", Config.BLUE),
+                   (1500, "GREAT!", Config.GREEN), (3000, "AMAZING!", Config.ORANGE),
+                   (5000, "LEGENDARY!", Config.YELLOW)]
+        self._rating_thresholds = tuple(threshold for threshold, _, _ in ratings)
+        self._rating_surfs = tuple(self.small_font.render(label, True, color) for _, label, color in ratings)
         
         # UI elements
         self.start_button_rect = None
+        self._hud_cache: Dict[str, Tuple[object, pygame.Surface]] = {}  # field -> (value, surface)
+        
+        # Areas drawn this frame and last frame, for partial display updates; None
+        # when the frame changed the whole screen and has to be flipped in full
+        self._dirty_rects = None
+        self._last_dirty_rects = None
         
         # Screen shake
         self.screen_shake = 0
         self.shake_offset = (0, 0)
+        self._shake_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
+        
+        # Per-state update and draw handlers for the main loop
+        self._updaters = {
+            GameState.OPENING_CRAWL: self.update_opening_crawl,
+            GameState.PLAYING: self.update_game,
+            GameState.CUTSCENE: self.update_cutscene,
+        }
+        self._drawers = {
+            GameState.OPENING_CRAWL: self.draw_opening_crawl,
+            GameState.MENU: self.draw_menu,
+            GameState.PLAYING: self.draw_game,
+            GameState.CUTSCENE: self.draw_cutscene,
+            GameState.GAME_OVER: self.draw_game_over,
+        }
     
     def handle_events(self):
         """Handle pygame events"""
@@ -707,6 +909,9 @@ class Game:
             if event.type == pygame.VIDEORESIZE:
                 Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT = event.w, event.h
                 self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), pygame.RESIZABLE)
+                self._screen_bounds.size = (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+                self._shake_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
+                self._last_dirty_rects = None  # The new display surface starts blank
                 
                 
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -724,7 +929,7 @@ class Game:
         self.lives = Config.INITIAL_LIVES
         self.score = 0
         self.cutscene_triggered = False
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = self.now
         self.player.rect.center = (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2)
         self.projectile_manager.clear()
         self.projectile_manager.set_active(True)
@@ -752,67 +957,83 @@ class Game:
         """Update game logic"""
         if self.state != GameState.PLAYING:
             return
+        
+        # Bind the per-frame hot attributes to locals once
+        now = self.now
+        player = self.player
+        player_rect = player.rect
+        projectile_manager = self.projectile_manager
+        particle_system = self.particle_system
             
         # Check for cutscene trigger (only once when score reaches 1000)
         if (not self.cutscene_triggered and 
             self.score >= Config.CUTSCENE_TRIGGER_SCORE):
             self.cutscene_triggered = True
             self.state = GameState.CUTSCENE
-            self.cutscene.start(self.player.rect)
-            self.player.freeze(True)
-            self.projectile_manager.set_active(False)
+            self.cutscene.start(player_rect, now)
+            player.freeze(True)
+            projectile_manager.set_active(False)
             return
         
         # Handle player input
+        # Decode the directional keys once for both move and dash
         keys = pygame.key.get_pressed()
-        self.player.move(keys)
+        dx = (keys[pygame.K_d] or keys[pygame.K_RIGHT]) - (keys[pygame.K_a] or keys[pygame.K_LEFT])
+        dy = (keys[pygame.K_s] or keys[pygame.K_DOWN]) - (keys[pygame.K_w] or keys[pygame.K_UP])
+        dash_pressed = keys[pygame.K_SPACE] or keys[pygame.K_LSHIFT]
+        player.move(dx, dy)
         
         # Handle dash
-        if self.player.dash(keys):
-            self.particle_system.add_trail(self.player.rect.centerx, self.player.rect.centery)
+        if player.dash(dx, dy, dash_pressed, now):
+            particle_system.add_trail(player_rect.centerx, player_rect.centery)
         
-        self.player.update()
+        player.update(now)
         
         # Update difficulty
-        self.projectile_manager.update_difficulty(self.score)
+        projectile_manager.update_difficulty(self.score)
         
         # Update projectiles
-        self.projectile_manager.update(self.player)
+        projectile_manager.update(player)
         
         # Update particles
-        self.particle_system.update()
-        
-        # Update power-ups
-        self.powerups = [p for p in self.powerups if p.update()]
+        particle_system.update()
         
         # Spawn power-ups
         if random.random() < Config.POWERUP_SPAWN_CHANCE:
             x = random.randint(50, Config.SCREEN_WIDTH - 50)
             y = random.randint(50, Config.SCREEN_HEIGHT - 50)
-            self.powerups.append(PowerUp(x, y))
+            self.powerups.append(PowerUp(x, y, now))
+        
+        # Update power-ups, dropping expired ones
+        powerups = [p for p in self.powerups if p.update(now)]
         
-        # Check power-up collection
-        for powerup in self.powerups[:]:
-            if powerup.rect.colliderect(self.player.rect):
+        # Check power-up collection with a single sweep in C
+        hits = player_rect.collidelistall([p.rect for p in powerups])
+        if hits:
+            for i in hits:
+                powerup = powerups[i]
                 if powerup.type == PowerUpType.MULTI_LIFE:
                     self.lives += 1
                 else:
-                    self.player.activate_powerup(powerup.type)
+                    player.activate_powerup(powerup.type, now)
                 
-                self.particle_system.add_explosion(
+                particle_system.add_explosion(
                     powerup.rect.centerx, powerup.rect.centery,
-                    powerup.properties[powerup.type]['color']
+                    PowerUp.COLORS[powerup.type]
                 )
-                self.powerups.remove(powerup)
+            
+            collected = set(hits)
+            powerups = [p for i, p in enumerate(powerups) if i not in collected]
+        self.powerups = powerups
         
         # Check collisions
-        if self.projectile_manager.check_collision(self.player.rect, self.player):
-            if not self.player.shield_active:
+        if projectile_manager.check_collision(player_rect, player):
+            if not player.shield_active:
                 self.lives -= 1
                 self.asset_manager.sounds['hit'].play()
                 self.screen_shake = 10
-                self.particle_system.add_explosion(
-                    self.player.rect.centerx, self.player.rect.centery, Config.RED
+                particle_system.add_explosion(
+                    player_rect.centerx, player_rect.centery, Config.RED
                 )
                 
                 if self.lives <= 0:
@@ -823,8 +1044,11 @@ class Game:
         # Update screen shake
         if self.screen_shake > 0:
             self.screen_shake -= 1
-            self.shake_offset = (random.randint(-self.screen_shake, self.screen_shake),
-                               random.randint(-self.screen_shake, self.screen_shake))
+            # Both offsets from one 16-bit draw: one byte per axis, folded into [-shake, shake]
+            shake = self.screen_shake
+            span = 2 * shake + 1
+            bits = random.getrandbits(16)
+            self.shake_offset = ((bits & 0xFF) % span - shake, (bits >> 8) % span - shake)
         else:
             self.shake_offset = (0, 0)
         
@@ -833,18 +1057,26 @@ class Game:
     
     def update_cutscene(self):
         """Update cutscene state"""
-        if self.cutscene.update():
+        if self.cutscene.update(self.now):
             self.state = GameState.PLAYING
             self.player.freeze(False)
             self.projectile_manager.set_active(True)
     
+    def draw_opening_crawl(self):
+        """Draw opening crawl"""
+        self.opening_crawl.draw(self.screen)
+    
     def draw_menu(self):
         """Draw menu screen"""
-        # Scale and draw background
-        bg_scaled = pygame.transform.scale(
-            self.asset_manager.images['menu_bg'],
-            (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
-        )
+        # Draw background, scaled once per window size
+        images = self.asset_manager.images
+        bg_scaled = images.get('menu_bg_scaled')
+        if bg_scaled is None or bg_scaled.get_size() != (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT):
+            bg_scaled = pygame.transform.scale(
+                images['menu_bg'],
+                (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+            ).convert()
+            images['menu_bg_scaled'] = bg_scaled
         self.screen.blit(bg_scaled, (0, 0))
         
         # Draw start button
@@ -854,143 +1086,152 @@ class Game:
         self.screen.blit(self.asset_manager.images['start_button'], self.start_button_rect)
         
         # Draw controls
-        controls = [
-            "Controls:",
-            "WASD or Arrow Keys - Move",
-            "Space or Shift - Dash",
-            "",
-            "Power-ups:",
-            "S - Shield", "R - Slow Projectiles", 
-            "T - Slow Time", "+ - Extra Life"
-        ]
-        
-        for i, text in enumerate(controls):
-            color = Config.YELLOW if i == 0 or i == 4 else Config.WHITE
-            font = self.font if i == 0 or i == 4 else self.small_font
-            if text:  # Skip empty lines
-                control_text = font.render(text, True, color)
-                self.screen.blit(control_text, (50, 50 + i * 25))
+        self.screen.blits(self._menu_control_blits, doreturn=False)
     
     def draw_game(self):
         """Draw game screen"""
         self.screen.fill(Config.BACKGROUND_COLOR)
         
-        # Apply screen shake
-        shake_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-        shake_surface.fill(Config.BACKGROUND_COLOR)
-        
-        # Draw game objects on shake surface
-        self.player.draw(shake_surface)
-        self.projectile_manager.draw(shake_surface)
-        self.particle_system.draw(shake_surface)
-        
-        # Draw power-ups
-        for powerup in self.powerups:
-            powerup.draw(shake_surface)
+        # Apply screen shake, reusing the pre-sized shake surface; without an
+        # offset, draw straight to the screen and skip the full-screen blit
+        shaking = self.shake_offset != (0, 0)
+        if shaking:
+            target = self._shake_surface
+            target.fill(Config.BACKGROUND_COLOR)
+        else:
+            target = self.screen
+        
+        # Draw game objects, collecting the areas they cover
+        dirty = self.player.draw(target, self.now)
+        dirty += self.projectile_manager.draw(target)
+        dirty += self.particle_system.draw(target)
+        
+        # Draw on-screen power-ups in one batched blit, culled in C against
+        # the screen rect grown by the sprites' glow margin
+        offset = PowerUp.IMAGE_OFFSET
+        powerups = self.powerups
+        visible = target.get_rect().inflate(-2 * offset, -2 * offset).collidelistall(
+            [powerup.rect for powerup in powerups])
+        dirty += target.blits([(powerups[i].image, (powerups[i].rect.x + offset, powerups[i].rect.y + offset))
+                               for i in visible])
         
         # Blit shake surface with offset
-        self.screen.blit(shake_surface, self.shake_offset)
+        if shaking:
+            self.screen.blit(target, self.shake_offset)
         
         # Draw UI (not affected by shake)
-        self.draw_ui()
+        dirty += self.draw_ui()
+        
+        # A shaken frame moves everything, so only unshaken frames can be presented by region
+        self._dirty_rects = None if shaking else dirty
+    
+    def _hud_text(self, field: str, fmt: str, value, font: pygame.font.Font, color) -> pygame.Surface:
+        """Return the rendered HUD text for field, formatting and re-rendering only when value changes"""
+        cached = self._hud_cache.get(field)
+        if cached is None or cached[0] != value:
+            cached = (value, font.render(fmt.format(value), True, color))
+            self._hud_cache[field] = cached
+        return cached[1]
     
-    def draw_ui(self):
-        """Draw user interface"""
+    def draw_ui(self) -> List[pygame.Rect]:
+        """Draw user interface, returning the screen areas drawn"""
+        # Bind the per-frame hot attributes to locals once
+        blit = self.screen.blit
+        hud_text = self._hud_text
+        font, small_font = self.font, self.small_font
+        player = self.player
+        score = self.score
+        screen_w = Config.SCREEN_WIDTH
+        dirty = []
+        
         # Lives
-        lives_text = self.font.render(f"Lives: {self.lives}", True, Config.WHITE)
-        self.screen.blit(lives_text, (10, 10))
+        lives_text = hud_text('lives', "Lives: {}", self.lives, font, Config.WHITE)
+        dirty.append(blit(lives_text, (10, 10)))
         
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, Config.WHITE)
-        self.screen.blit(score_text, (10, 50))
+        score_text = hud_text('score', "Score: {}", score, font, Config.WHITE)
+        dirty.append(blit(score_text, (10, 50)))
         
         # Difficulty
         diff_level = int(self.projectile_manager.difficulty_multiplier * 10) / 10
-        diff_text = self.small_font.render(f"Difficulty: {diff_level}x", True, Config.YELLOW)
-        self.screen.blit(diff_text, (10, 90))
+        diff_text = hud_text('difficulty', "Difficulty: {}x", diff_level, small_font, Config.YELLOW)
+        dirty.append(blit(diff_text, (10, 90)))
         
         # Dash cooldown indicator
-        current_time = pygame.time.get_ticks()
-        dash_ready = current_time - self.player.last_dash_time > Config.DASH_COOLDOWN
+        current_time = self.now
+        dash_ready = current_time - player.last_dash_time > Config.DASH_COOLDOWN
         dash_color = Config.GREEN if dash_ready else Config.RED
-        dash_text = self.small_font.render("DASH READY" if dash_ready else "DASH COOLDOWN", True, dash_color)
-        self.screen.blit(dash_text, (Config.SCREEN_WIDTH - 150, 10))
+        dash_text = hud_text('dash', "DASH READY" if dash_ready else "DASH COOLDOWN", dash_ready,
+                             small_font, dash_color)
+        dirty.append(blit(dash_text, (screen_w - 150, 10)))
         
-        # Power-up indicators
+        # Power-up indicators, timed in seconds rounded to the displayed tenth
         y_offset = 40
-        if self.player.shield_active:
-            time_left = (self.player.shield_end_time - current_time) / 1000
-            shield_text = self.small_font.render(f"SHIELD: {time_left:.1f}s", True, Config.BLUE)
-            self.screen.blit(shield_text, (Config.SCREEN_WIDTH - 150, y_offset))
+        if player.shield_active:
+            time_left = (player.shield_end_time - current_time + 50) // 100 / 10
+            shield_text = hud_text('shield', "SHIELD: {:.1f}s", time_left, small_font, Config.BLUE)
+            dirty.append(blit(shield_text, (screen_w - 150, y_offset)))
             y_offset += 25
         
-        if self.player.rapid_fire_active:
-            time_left = (self.player.rapid_fire_end_time - current_time) / 1000
-            rapid_text = self.small_font.render(f"SLOW PROJECTILES: {time_left:.1f}s", True, Config.RED)
-            self.screen.blit(rapid_text, (Config.SCREEN_WIDTH - 200, y_offset))
+        if player.rapid_fire_active:
+            time_left = (player.rapid_fire_end_time - current_time + 50) // 100 / 10
+            rapid_text = hud_text('rapid_fire', "SLOW PROJECTILES: {:.1f}s", time_left,
+                                  small_font, Config.RED)
+            dirty.append(blit(rapid_text, (screen_w - 200, y_offset)))
             y_offset += 25
         
-        if self.player.slow_time_active:
-            time_left = (self.player.slow_time_end_time - current_time) / 1000
-            slow_text = self.small_font.render(f"SLOW TIME: {time_left:.1f}s", True, Config.PURPLE)
-            self.screen.blit(slow_text, (Config.SCREEN_WIDTH - 150, y_offset))
+        if player.slow_time_active:
+            time_left = (player.slow_time_end_time - current_time + 50) // 100 / 10
+            slow_text = hud_text('slow_time', "SLOW TIME: {:.1f}s", time_left, small_font, Config.PURPLE)
+            dirty.append(blit(slow_text, (screen_w - 150, y_offset)))
             y_offset += 25
         
         # Score milestone indicator
-        if not self.cutscene_triggered and self.score < Config.CUTSCENE_TRIGGER_SCORE:
-            remaining = Config.CUTSCENE_TRIGGER_SCORE - self.score
-            milestone_text = self.small_font.render(f"Story Event in: {remaining}", True, Config.CYAN)
-            milestone_rect = milestone_text.get_rect(center=(Config.SCREEN_WIDTH // 2, 30))
-            self.screen.blit(milestone_text, milestone_rect)
+        if not self.cutscene_triggered and score < Config.CUTSCENE_TRIGGER_SCORE:
+            remaining = Config.CUTSCENE_TRIGGER_SCORE - score
+            milestone_text = hud_text('milestone', "Story Event in: {}", remaining, small_font, Config.CYAN)
+            milestone_rect = milestone_text.get_rect(center=(screen_w // 2, 30))
+            dirty.append(blit(milestone_text, milestone_rect))
+        
+        return dirty
     
     def draw_cutscene(self):
         """Draw cutscene"""
         self.draw_game()  # Draw game elements first
         self.cutscene.draw(self.screen, self.player.rect)
+        self._dirty_rects = None  # The overlay is not tracked, so present the frame in full
     
     def draw_game_over(self):
         """Draw game over screen"""
         self.screen.fill(Config.BACKGROUND_COLOR)
         
-        # Game over text with glow effect
-        game_over_text = self.font.render("Game Over!", True, Config.RED)
-        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            glow_text = self.font.render("Game Over!", True, (100, 0, 0))
-            glow_rect = glow_text.get_rect(center=(Config.SCREEN_WIDTH // 2 + offset[0], 
-                                                 Config.SCREEN_HEIGHT // 2 - 50 + offset[1]))
-            self.screen.blit(glow_text, glow_rect)
-        
-        game_over_rect = game_over_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(game_over_text, game_over_rect)
+        # Game over text with glow effect, laid out again only when the screen is resized
+        screen_size = (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+        if self._game_over_size != screen_size:
+            self._game_over_size = screen_size
+            center_x, center_y = Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 - 50
+            glow_text = self._game_over_glow
+            self._game_over_blits = [
+                (glow_text, glow_text.get_rect(center=(center_x + dx, center_y + dy)))
+                for dx, dy in [(2, 2), (-2, -2), (2, -2), (-2, 2)]
+            ]
+            self._game_over_blits.append(
+                (self._game_over_text, self._game_over_text.get_rect(center=(center_x, center_y)))
+            )
+        self.screen.blits(self._game_over_blits, doreturn=False)
         
         # Final score
         final_score_text = self.font.render(f"Final Score: {self.score}", True, Config.WHITE)
         score_rect = final_score_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2))
         self.screen.blit(final_score_text, score_rect)
         
-        # Performance rating
-        if self.score >= 5000:
-            rating = "LEGENDARY!"
-            rating_color = Config.YELLOW
-        elif self.score >= 3000:
-            rating = "AMAZING!"
-            rating_color = Config.ORANGE
-        elif self.score >= 1500:
-            rating = "GREAT!"
-            rating_color = Config.GREEN
-        elif self.score >= 1000:
-            rating = "GOOD!"
-            rating_color = Config.BLUE
-        else:
-            rating = "Keep Trying!"
-            rating_color = Config.WHITE
-        
-        rating_text = self.small_font.render(rating, True, rating_color)
+        # Performance rating: highest threshold not above the score
+        rating_text = self._rating_surfs[bisect_right(self._rating_thresholds, self.score) - 1]
         rating_rect = rating_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 + 30))
         self.screen.blit(rating_text, rating_rect)
         
         # Click to continue
-        continue_text = self.small_font.render("Click anywhere to return to menu", True, Config.WHITE)
+        continue_text = self._continue_text
         continue_rect = continue_text.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2 + 80))
         self.screen.blit(continue_text, continue_rect)
     
@@ -999,32 +1240,32 @@ class Game:
         running = True
         
         while running:
+            # Read the clock once; every handler this frame shares self.now
+            self.now = pygame.time.get_ticks()
+            
             # Handle events
             running = self.handle_events()
             if not running:
                 break
             
             # Update game state
-            if self.state == GameState.OPENING_CRAWL:
-                self.update_opening_crawl()
-            elif self.state == GameState.PLAYING:
-                self.update_game()
-            elif self.state == GameState.CUTSCENE:
-                self.update_cutscene()
+            updater = self._updaters.get(self.state)
+            if updater is not None:
+                updater()
             
             # Draw everything
-            if self.state == GameState.OPENING_CRAWL:
-                self.opening_crawl.draw(self.screen)
-            elif self.state == GameState.MENU:
-                self.draw_menu()
-            elif self.state == GameState.PLAYING:
-                self.draw_game()
-            elif self.state == GameState.CUTSCENE:
-                self.draw_cutscene()
-            elif self.state == GameState.GAME_OVER:
-                self.draw_game_over()
+            self._drawers[self.state]()
+            
+            # Present only what changed since the last frame when both frames
+            # were drawn region by region; flip the whole screen otherwise
+            dirty = self._dirty_rects
+            if dirty is not None and self._last_dirty_rects is not None:
+                pygame.display.update(dirty + self._last_dirty_rects)
+            else:
+                pygame.display.flip()
+            self._last_dirty_rects = dirty
+            self._dirty_rects = None
             
-            pygame.display.flip()
             self.clock.tick(Config.FPS)
         
         pygame.quit()
@@ -0,0 +1,51 @@
+"""Extract the player GIF animation into PNG frames the game can load directly.
+
+Run from the repository root whenever images/player.gif changes:
+    
+    python tools/extract_gif.py [gif_path] [output_dir]
+
+Frames are written as images/player/frame_000.png, frame_001.png, ... already
+scaled by PLAYER_SCALE with Lanczos resampling, so the game loads them as-is.
+This is the only place Pillow is needed.
+"""
+import os
+import sys
+
+from PIL import Image
+
+DEFAULT_GIF = "images/player.gif"
+DEFAULT_OUTPUT_DIR = "images/player"
+PLAYER_SCALE = 2  # On-screen size of the player sprite relative to the GIF
+
+
+def extract_frames(gif_path: str, output_dir: str, scale: int = PLAYER_SCALE) -> int:
+    """Write every frame of gif_path as a scaled RGBA PNG. Returns the frame count"""
+    if not os.path.exists(gif_path):
+        raise FileNotFoundError(f"GIF file not found: {gif_path}")
+    
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Remove stale frames so a shorter animation doesn't keep old ones around
+    for name in os.listdir(output_dir):
+        if name.startswith("frame_") and name.endswith(".png"):
+            os.remove(os.path.join(output_dir, name))
+    
+    gif = Image.open(gif_path)
+    count = 0
+    try:
+        while True:
+            frame = gif.copy().convert("RGBA")
+            frame = frame.resize((frame.width * scale, frame.height * scale), Image.LANCZOS)
+            frame.save(os.path.join(output_dir, f"frame_{count:03d}.png"))
+            count += 1
+            gif.seek(count)
+    except EOFError:
+        pass
+    return count
+
+
+if __name__ == "__main__":
+    gif_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_GIF
+    output_dir = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_OUTPUT_DIR
+    count = extract_frames(gif_path, output_dir)
+    print(f"Wrote {count} frames to {output_dir}")